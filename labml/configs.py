@@ -156,7 +156,7 @@ def calculate(name: any, *args: any):
             option_name = arg
         elif isinstance(arg, list):
             pass_params = arg
-        elif type(arg) == type:
+        elif isinstance(arg, type):
             func = arg
         else:
             func = arg
@@ -1,6 +1,6 @@
+import enum
 import types
 import warnings
-from collections import OrderedDict
 from typing import Dict, List, Callable, Union, Tuple, Optional, Type, Set, Iterable
 
 from .config_function import ConfigFunction
@@ -31,23 +31,27 @@ def _is_class_method(func: Callable):
     return True
 
 
-RESERVED_CLASS = {'calc', 'list', 'set_hyperparams', 'set_meta', 'aggregate', 'calc_wrap'}
-RESERVED_INSTANCE = {'_to_json', '_reset_explicitly_specified', '_set_update_callback', '_set_values', '_get_type'}
+RESERVED_CLASS = frozenset(('calc', 'list', 'set_hyperparams', 'set_meta', 'aggregate', 'calc_wrap'))
+RESERVED_INSTANCE = frozenset(('_to_json', '_reset_explicitly_specified', '_set_update_callback', '_set_values',
+                               '_get_type'))
+_RESERVED = RESERVED_CLASS | RESERVED_INSTANCE
 
 _STANDARD_TYPES = {int, str, bool, float, Dict, List}
 
+_MISSING = object()
+
 
 def _is_valid(key):
     if key.startswith('_'):
         return False
 
-    if key in RESERVED_CLASS or key in RESERVED_INSTANCE:
+    if key in _RESERVED:
         return False
 
     return True
 
 
-def _get_base_classes(class_: Type['Configs']) -> List[Type['Configs']]:
+def _get_base_classes(class_: Type['Configs']) -> Tuple[Type['Configs'], ...]:
     classes = [class_]
     level = [class_]
     next_level = []
@@ -71,7 +75,7 @@ def _get_base_classes(class_: Type['Configs']) -> List[Type['Configs']]:
             unique_classes.append(c)
         hashes.add(hash(c))
 
-    return unique_classes
+    return tuple(unique_classes)
 
 
 class PropertyKeys:
@@ -80,6 +84,109 @@ class PropertyKeys:
     hyperparams = '_hyperparams'
     aggregates = '_aggregates'
     meta = '_meta'
+    schema = '_schema'
+
+
+class _ConfigsSchema:
+    """
+    Class level declarations of a configs class, collected from all its base classes.
+    """
+
+    types: Dict[str, Type]
+    values: Dict[str, any]
+    options: Dict[str, Dict[str, ConfigFunction]]
+    evals: Dict[str, Dict[str, EvalFunction]]
+    config_items: Dict[str, ConfigItem]
+    aggregates: Dict[str, Dict[str, Dict[str, any]]]
+    aggregates_options: Dict[str, Set[str]]
+    hyperparams: Dict[str, bool]
+    meta: Dict[str, bool]
+
+    def __init__(self, classes: Tuple[Type['Configs'], ...]):
+        types = self.types = {}
+        values = self.values = {}
+        options = self.options = {}
+        evals = self.evals = {}
+        config_items = self.config_items = {}
+        aggregates = self.aggregates = {}
+        aggregates_options = self.aggregates_options = {}
+        hyperparams = self.hyperparams = {}
+        meta = self.meta = {}
+
+        for c in classes:
+            class_dict = c.__dict__
+            class_evaluators = class_dict.get(PropertyKeys.evaluators, {})
+
+            items = [(k, v) for k, v in class_dict.items()
+                     if not k.startswith('_') and k not in _RESERVED and k not in class_evaluators]
+
+            for k, v in items:
+                if v.has_value:
+                    values[k] = v.value
+
+                if k in config_items:
+                    config_items[k].update(v)
+                else:
+                    config_items[k] = v
+
+                if k not in types:
+                    types[k] = v.annotation
+
+            for k, calculators in class_dict.get(PropertyKeys.calculators, {}).items():
+                if k not in options:
+                    options[k] = {}
+                k_options = options[k]
+                for v in calculators:
+                    if v.option_name in k_options:
+                        if v != k_options[v.option_name]:
+                            warnings.warn(f"Overriding option for {k}: {v.option_name}", Warning, stacklevel=6)
+
+                    k_options[v.option_name] = v
+
+            for k, evaluators in class_evaluators.items():
+                for v in evaluators:
+                    if k not in evals:
+                        evals[k] = {}
+
+                    evals[k]['default'] = v
+
+            for key, key_aggregates in class_dict.get(PropertyKeys.aggregates, {}).items():
+                for option, pairs in key_aggregates.items():
+                    if key not in aggregates_options:
+                        aggregates_options[key] = set()
+                    aggregates_options[key].add(option)
+                    for name, value in pairs.items():
+                        if name not in aggregates:
+                            aggregates[name] = {}
+                        if key not in aggregates[name]:
+                            aggregates[name][key] = {}
+                        aggregates[name][key][option] = value
+
+            hyperparams.update(class_dict.get(PropertyKeys.hyperparams, {}))
+            meta.update(class_dict.get(PropertyKeys.meta, {}))
+
+        for k in options:
+            if k not in types:
+                raise RuntimeError(f"{k} calculator is present but the config declaration is missing")
+
+
+def _get_schema(class_: Type['Configs']) -> _ConfigsSchema:
+    schema = class_.__dict__.get(PropertyKeys.schema)
+    if schema is not None:
+        return schema
+
+    schema = _ConfigsSchema(_get_base_classes(class_))
+    setattr(class_, PropertyKeys.schema, schema)
+
+    return schema
+
+
+def _clear_schema(class_: Type['Configs']):
+    # Options, evaluators, hyperparams and aggregates can be added to a class
+    # after it or its subclasses were instantiated
+    setattr(class_, PropertyKeys.schema, None)
+    for sub_class in class_.__subclasses__():
+        _clear_schema(sub_class)
 
 
 class Configs:
@@ -88,6 +195,7 @@ class Configs:
     _hyperparams: Dict[str, bool]
     _aggregates: Dict[str, Dict[str, Dict[ConfigItem, any]]]
     _meta: Dict[str, bool]
+    _schema: Optional[_ConfigsSchema] = None
 
     __config_items: Dict[str, ConfigItem]
     __options: Dict[str, Dict[str, ConfigFunction]]
@@ -117,8 +225,6 @@ class Configs:
         self.__cached = {}
         self.__cached_configs = {}
 
-        classes = _get_base_classes(type(self))
-
         self.__types = {}
         self.__options = {}
         self.__evals = {}
@@ -135,82 +241,16 @@ class Configs:
 
         self.__update_callback = None
 
-        self.__collect_config_items(classes)
-        self.__collect_calculator(classes)
-        self.__collect_evaluator(classes)
-        self.__collect_aggregates(classes)
-
-        for c in classes:
-            if PropertyKeys.hyperparams in c.__dict__:
-                for k, is_hyperparam in c.__dict__[PropertyKeys.hyperparams].items():
-                    self.__hyperparams[k] = is_hyperparam
-
-        for c in classes:
-            if PropertyKeys.meta in c.__dict__:
-                for k, is_meta in c.__dict__[PropertyKeys.meta].items():
-                    self.__meta[k] = is_meta
-
-    def __collect_config_items(self, classes: List[Type['Configs']]):
-        for c in classes:
-            for k, v in c.__dict__.items():
-                if PropertyKeys.evaluators in c.__dict__ and k in c.__dict__[PropertyKeys.evaluators]:
-                    continue
-                if not _is_valid(k):
-                    continue
-
-                if v.has_value:
-                    self.__values[k] = v.value
-
-                if k in self.__config_items:
-                    self.__config_items[k].update(v)
-                else:
-                    self.__config_items[k] = v
-
-                if k not in self.__types:
-                    self.__types[k] = v.annotation
-
-    def __collect_calculator(self, classes: List[Type['Configs']]):
-        for c in classes:
-            if PropertyKeys.calculators not in c.__dict__:
-                continue
-            for k, calculators in c.__dict__[PropertyKeys.calculators].items():
-                if k not in self.__types:
-                    raise RuntimeError(f"{k} calculator is present but the config declaration is missing")
-                for v in calculators:
-                    if k not in self.__options:
-                        self.__options[k] = OrderedDict()
-                    if v.option_name in self.__options[k]:
-                        if v != self.__options[k][v.option_name]:
-                            warnings.warn(f"Overriding option for {k}: {v.option_name}", Warning, stacklevel=5)
-
-                    self.__options[k][v.option_name] = v
-
-    def __collect_evaluator(self, classes: List[Type['Configs']]):
-        for c in classes:
-            if PropertyKeys.evaluators not in c.__dict__:
-                continue
-            for k, evaluators in c.__dict__[PropertyKeys.evaluators].items():
-                for v in evaluators:
-                    if k not in self.__evals:
-                        self.__evals[k] = OrderedDict()
-
-                    self.__evals[k]['default'] = v
-
-    def __collect_aggregates(self, classes: List[Type['Configs']]):
-        for c in classes:
-            if PropertyKeys.aggregates not in c.__dict__:
-                continue
-            for key, aggregates in c.__dict__[PropertyKeys.aggregates].items():
-                for option, pairs in aggregates.items():
-                    if key not in self.__aggregates_options:
-                        self.__aggregates_options[key] = set()
-                    self.__aggregates_options[key].add(option)
-                    for name, value in pairs.items():
-                        if name not in self.__aggregates:
-                            self.__aggregates[name] = {}
-                        if key not in self.__aggregates[name]:
-                            self.__aggregates[name][key] = {}
-                        self.__aggregates[name][key][option] = value
+        schema = _get_schema(type(self))
+        self.__values.update(schema.values)
+        self.__types.update(schema.types)
+        self.__options.update({k: dict(v) for k, v in schema.options.items()})
+        self.__evals.update(schema.evals)
+        self.__config_items.update(schema.config_items)
+        self.__hyperparams.update(schema.hyperparams)
+        self.__meta.update(schema.meta)
+        self.__aggregates.update(schema.aggregates)
+        self.__aggregates_options.update(schema.aggregates_options)
 
     def __dir__(self) -> Iterable[str]:
         return [k for k in self.__types]
@@ -251,16 +291,18 @@ class Configs:
         return None, False
 
     def __get_value_direct(self, item):
-        if item in self.__values_override:
-            return self.__values_override[item], True
-        elif item in self.__values:
-            return self.__values[item], True
-        else:
-            return None, False
+        value = self.__values_override.get(item, _MISSING)
+        if value is not _MISSING:
+            return value, True
+        value = self.__values.get(item, _MISSING)
+        if value is not _MISSING:
+            return value, True
+        return None, False
 
     def __get_value(self, item):
-        if item in self.__cached:
-            return self.__cached[item]
+        value = self.__cached.get(item, _MISSING)
+        if value is not _MISSING:
+            return value, True
 
         value, has = self.__get_value_direct(item)
 
@@ -271,8 +313,9 @@ class Configs:
         if has:
             return value, has
 
-        if item in self.__options:
-            return next(iter(self.__options[item].keys())), True
+        options = self.__options.get(item)
+        if options is not None:
+            return next(iter(options)), True
 
         return None, False
 
@@ -281,25 +324,27 @@ class Configs:
         self.__n_calculated += 1
 
         value, has = self.__get_value(item)
+        t = self.__types.get(item, _MISSING)
 
         if has:
             pass
-        elif item not in self.__types:
+        elif t is _MISSING:
             raise AttributeError(f"{self.__class__.__name__} has no attribute `{item}`")
-        elif type(self.__types[item]) == type and self.__types[item] not in _STANDARD_TYPES:
-            config_function = ConfigFunction(self.__types[item],
+        elif isinstance(t, type) and t not in _STANDARD_TYPES and not issubclass(t, enum.Enum):
+            config_function = ConfigFunction(t,
                                              config_names=self.__config_items[item],
                                              option_name='from_type')
 
-            self.__options[item] = OrderedDict()
+            self.__options[item] = {}
             self.__options[item]['from_type'] = config_function
             self.__values[item] = 'from_type'
             value = 'from_type'
         else:
             raise AttributeError(f"{self.__class__.__name__} cannot calculate config `{item}`")
 
-        if item in self.__options and value in self.__options[item]:
-            func = self.__options[item][value]
+        options = self.__options.get(item)
+        if options is not None and value in options:
+            func = options[value]
             with monit.section(f'Prepare {item}'):
                 value = func(self)
 
@@ -318,6 +363,8 @@ class Configs:
         self.__cached[item] = value
 
     def __init_subclass__(cls, **kwargs):
+        cls._schema = None
+
         configs = {}
 
         for k, v in cls.__annotations__.items():
@@ -358,6 +405,8 @@ class Configs:
                              name: Union[ConfigItem, List[ConfigItem]],
                              option: Optional[str],
                              pass_params: Optional[List[ConfigItem]]):
+        _clear_schema(cls)
+
         if PropertyKeys.calculators not in cls.__dict__:
             cls._calculators = {}
 
@@ -365,7 +414,7 @@ class Configs:
                               config_names=name,
                               option_name=option,
                               pass_params=pass_params)
-        if type(calc.config_names) == str:
+        if isinstance(calc.config_names, str):
             config_names = [calc.config_names]
         else:
             config_names = calc.config_names
@@ -379,6 +428,8 @@ class Configs:
     def _add_eval_function(cls,
                            func: Callable,
                            name: str):
+        _clear_schema(cls)
+
         if PropertyKeys.evaluators not in cls.__dict__:
             cls._evaluators = {}
 
@@ -413,6 +464,8 @@ class Configs:
 
     @classmethod
     def set_hyperparams(cls, *args: ConfigItem, is_hyperparam=True):
+        _clear_schema(cls)
+
         if PropertyKeys.hyperparams not in cls.__dict__:
             cls._hyperparams = {}
 
@@ -421,6 +474,8 @@ class Configs:
 
     @classmethod
     def set_meta(cls, *args: ConfigItem, is_meta=True):
+        _clear_schema(cls)
+
         if PropertyKeys.meta not in cls.__dict__:
             cls._meta = {}
 
@@ -432,6 +487,8 @@ class Configs:
                   *args: Tuple[ConfigItem, any]):
         assert args
 
+        _clear_schema(cls)
+
         if PropertyKeys.aggregates not in cls.__dict__:
             cls._aggregates = {}
 
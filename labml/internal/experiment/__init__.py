@@ -4,8 +4,6 @@ import pathlib
 import time
 from typing import Optional, List, Set, Dict, Union, TYPE_CHECKING
 
-import git
-
 from labml import logger, monit
 from labml.internal.configs.base import Configs
 from labml.internal.configs.processor import ConfigProcessor, FileConfigsSaver
@@ -62,12 +60,9 @@ class CheckpointSaver:
             return
 
         checkpoints_path = pathlib.Path(self.path)
-        if not checkpoints_path.exists():
-            checkpoints_path.mkdir()
+        checkpoints_path.mkdir(exist_ok=True)
 
         checkpoint_path = checkpoints_path / str(global_step)
-        assert not checkpoint_path.exists()
-
         checkpoint_path.mkdir()
 
         info = {}
@@ -75,8 +70,8 @@ class CheckpointSaver:
             info[name] = saver.save(checkpoint_path)
 
         # Save header
-        with open(str(checkpoint_path / "info.json"), "w") as f:
-            f.write(json.dumps(info))
+        with open(str(checkpoint_path / "info.json"), "w", buffering=1 << 16) as f:
+            json.dump(info, f, separators=(',', ':'))
 
     def load(self, checkpoint_path: pathlib.Path, models: List[str] = None):
         """
@@ -92,22 +87,15 @@ class CheckpointSaver:
             return
 
         if not models:
-            models = list(self.model_savers.keys())
+            models = self.model_savers.keys()
 
         with open(str(checkpoint_path / "info.json"), "r") as f:
-            info = json.loads(f.readline())
-
-        to_load = []
-        not_loaded = []
-        missing = []
-        for name in models:
-            if name not in info:
-                missing.append(name)
-            else:
-                to_load.append(name)
-        for name in info:
-            if name not in models:
-                not_loaded.append(name)
+            info = json.load(f)
+
+        models_set = set(models)
+        to_load = [name for name in models if name in info]
+        missing = [name for name in models if name not in info]
+        not_loaded = [name for name in info if name not in models_set]
 
         # Load each model
         for name in to_load:
@@ -204,13 +192,16 @@ class Experiment:
             comment=comment,
             tags=list(tags))
 
+        import git
+
         try:
             repo = git.Repo(lab_singleton().path)
 
-            self.run.commit = repo.head.commit.hexsha
-            self.run.commit_message = repo.head.commit.message.strip()
+            commit = repo.head.commit
+            self.run.commit = commit.hexsha
+            self.run.commit_message = commit.message.strip()
             self.run.is_dirty = repo.is_dirty()
-            self.run.diff = repo.git.diff()
+            self.run.diff = repo.git.diff() if self.run.is_dirty else ''
         except git.InvalidGitRepositoryError:
             if not is_colab() and not is_kaggle():
                 labml_notice(["Not a valid git repository: ",
@@ -273,10 +264,10 @@ class Experiment:
     def calc_configs(self,
                      configs: Union[Configs, Dict[str, any]],
                      configs_override: Optional[Dict[str, any]]):
-        if configs_override is None:
-            configs_override = {}
-        if global_params_singleton().configs is not None:
-            configs_override.update(global_params_singleton().configs)
+        configs_override = {} if configs_override is None else dict(configs_override)
+        global_configs = global_params_singleton().configs
+        if global_configs is not None:
+            configs_override.update(global_configs)
 
         self.configs_processor = ConfigProcessor(configs, configs_override)
 
@@ -314,8 +305,7 @@ class Experiment:
             self.checkpoint_saver.load(checkpoint_path, models)
 
     def _save_pid(self):
-        if not self.run.pids_path.exists():
-            self.run.pids_path.mkdir()
+        self.run.pids_path.mkdir(exist_ok=True)
 
         pid_path = self.run.pids_path / f'{self.distributed_rank}.pid'
         assert not pid_path.exists()
@@ -196,11 +196,7 @@ class Run(RunInfo):
 
     def make_path(self):
         run_path = Path(self.run_path)
-        if not run_path.exists():
-            try:
-                run_path.mkdir(parents=True)
-            except FileExistsError:
-                pass
+        run_path.mkdir(parents=True, exist_ok=True)
 
 
     def save_info(self):
@@ -20,7 +20,7 @@ FREQUENCY = 60
 class FileWriterThread(threading.Thread):
     def __init__(self, file_path: PurePath):
         super().__init__(daemon=False)
-        self.file_path = file_path
+        self.file_path = str(file_path)
         self.queue = Queue()
 
     def push(self, data: any):
@@ -40,7 +40,7 @@ class FileWriterThread(threading.Thread):
             data['accept'](res)
 
     def _send(self, data: Dict[str, any]):
-        with open(str(self.file_path), 'a') as f:
+        with open(self.file_path, 'a') as f:
             f.write(json.dumps(data) + '\n')
 
 
@@ -1,25 +1,25 @@
 import os
 import pathlib
-from typing import Set, List
+import sys
+from typing import Set
 
 
 def get_caller_file(ignore_callers: Set[str] = None):
     if ignore_callers is None:
         ignore_callers = {}
 
-    import inspect
+    lab_src = str(pathlib.PurePath(__file__).parent.parent) + '/'
 
-    frames: List[inspect.FrameInfo] = inspect.stack()
-    lab_src = pathlib.PurePath(__file__).parent.parent
-
-    for f in frames:
-        module_path = pathlib.PurePath(f.filename)
-        if str(module_path).startswith(str(lab_src) + '/'):
+    frame = sys._getframe()
+    while frame is not None:
+        module_path = str(pathlib.PurePath(frame.f_code.co_filename))
+        frame = frame.f_back
+        if module_path.startswith(lab_src):
             continue
-        if str(module_path) in ignore_callers:
+        if module_path in ignore_callers:
             continue
-        if str(module_path).startswith('<ipython'):
+        if module_path.startswith('<ipython'):
             break
-        return str(module_path)
+        return module_path
 
-    return os.path.abspath('')
\ No newline at end of file
+    return os.path.abspath('')
@@ -100,6 +100,44 @@ aggregate(MyConfigs.a, 'test',
           (MyConfigs.a2, 'test2'))
 
 
+class InheritX(Configs):
+    v: str = 'X'
+
+
+class InheritC(Configs):
+    v: str = 'C'
+
+
+class InheritB(InheritX):
+    pass
+
+
+class InheritD(InheritB, InheritC):
+    pass
+
+
+class CalcOnBase(Configs):
+    x: str
+
+
+class CalcOnBaseChild(CalcOnBase):
+    y: str
+
+
+@option([CalcOnBase.x, CalcOnBaseChild.y])
+def calc_on_base_xy(c: CalcOnBaseChild):
+    return 'xy'
+
+
+class LateBase(Configs):
+    late: str
+    late_h: str = 'h'
+
+
+class LateChild(LateBase):
+    pass
+
+
 # TEST: This should fail
 # @option(MyConfigs.undefined)
 # def undefined_config(c: MyConfigs):
@@ -169,6 +207,25 @@ def test():
     configs._set_values({'v_module2.m2': 'o2'})
     assert configs.v_module2.m2 == 'o2'
 
+    assert InheritD().v == 'C'
+
+    calc_on_base = CalcOnBaseChild()
+    assert calc_on_base.x == 'xy'
+    assert calc_on_base.y == 'xy'
+
+    # Options and hyperparams registered after instantiation
+    LateChild()
+
+    @option(LateBase.late)
+    def late_calc():
+        return 'late'
+
+    hyperparams(LateBase.late_h)
+
+    late_child = LateChild()
+    assert late_child.late == 'late'
+    assert late_child._to_json()['late_h']['is_hyperparam'] is True
+
     # import yaml
     # print(yaml.dump(configs._to_json()))
 